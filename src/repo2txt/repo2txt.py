@@ -3,6 +3,10 @@
 import os
 import argparse
 import json
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 
 def load_config(file_path):
@@ -21,15 +25,42 @@ def load_config(file_path):
 
 # Usage
 config = load_config("config.json")
-IMAGE_EXTENSIONS = config["image_extensions"]
-VIDEO_EXTENSIONS = config["video_extensions"]
-AUDIO_EXTENSIONS = config["audio_extensions"]
-DOCUMENT_EXTENSIONS = config["document_extensions"]
-EXECUTABLE_EXTENSIONS = config["executable_extensions"]
-SETTINGS_EXTENSIONS = config["settings_extensions"]
-ADDITIONAL_IGNORE_TYPES = config["additional_ignore_types"]
+IMAGE_EXTENSIONS = frozenset(config["image_extensions"])
+VIDEO_EXTENSIONS = frozenset(config["video_extensions"])
+AUDIO_EXTENSIONS = frozenset(config["audio_extensions"])
+DOCUMENT_EXTENSIONS = frozenset(config["document_extensions"])
+EXECUTABLE_EXTENSIONS = frozenset(config["executable_extensions"])
+SETTINGS_EXTENSIONS = frozenset(config["settings_extensions"])
+ADDITIONAL_IGNORE_TYPES = frozenset(config["additional_ignore_types"])
 DEFAULT_OUTPUT_FILE = config["default_output_file"]
 
+# Default ignore lists, unioned once at import time instead of being
+# rebuilt on every parse_args/main invocation
+_DEFAULT_IGNORE_TYPES = (
+    IMAGE_EXTENSIONS
+    | VIDEO_EXTENSIONS
+    | AUDIO_EXTENSIONS
+    | DOCUMENT_EXTENSIONS
+    | EXECUTABLE_EXTENSIONS
+)
+_DEFAULT_IGNORE_TYPES_WITH_EXTRA = _DEFAULT_IGNORE_TYPES | ADDITIONAL_IGNORE_TYPES
+
+# Buffer size for file reads and for the output file; many small writes
+# through the default 8 KiB buffer dominate the runtime on large repos
+_CHUNK_SIZE = 1 << 20
+
+# Worker threads for reading file contents; reads release the GIL, so a
+# small pool overlaps disk latency while a single writer preserves order
+_MAX_READ_WORKERS = 8
+
+# Largest file a read worker may buffer whole; bigger files are streamed
+# from disk in _CHUNK_SIZE blocks so memory use stays bounded
+_MAX_INLINE_SIZE = _CHUNK_SIZE
+
+# Sort key for scandir entries; attrgetter runs at C level, so the sort
+# pays no Python frame per entry
+_ENTRY_NAME = attrgetter("name")
+
 
 def parse_args():
     """
@@ -73,11 +104,7 @@ def parse_args():
     parser.add_argument(
         "--ignore-types",
         nargs="*",
-        default=IMAGE_EXTENSIONS
-        + VIDEO_EXTENSIONS
-        + AUDIO_EXTENSIONS
-        + DOCUMENT_EXTENSIONS
-        + EXECUTABLE_EXTENSIONS,
+        default=_DEFAULT_IGNORE_TYPES,
         help="List of file extensions to ignore. Defaults to list in config.json. Omit this argument to ignore no types.",
     )
     parser.add_argument(
@@ -105,184 +132,534 @@ def parse_args():
     return parser.parse_args()
 
 
-def should_ignore(item, args, output_file_path, gitignore_patterns):
+def make_should_ignore(args, gitignore_spec):
     """
-    Determine if a given item should be ignored based on the script's arguments.
+    Build the per-entry ignore predicate with all run-constant state
+    pre-bound.
+
+    The predicate runs once per filesystem entry, so its cost is pure
+    interpreter overhead: attribute lookups on args and the spec, flag
+    tests, and probes of several small sets. Everything run-constant is
+    resolved here once — the sets that apply to files and to directories
+    are merged up front, and the gitignore matcher is reduced to bound
+    methods — leaving the hot path as a handful of local-variable set
+    probes.
 
     Args:
-        item (str): The path of the item (file or directory) to check.
-        args (argparse.Namespace): Parsed command-line arguments.
-        output_file_path (str): The path of the output file being written to.
-        gitignore_patterns (list): List of patterns from .gitignore file.
+        args (argparse.Namespace): Parsed command-line arguments, augmented in
+            main() with the precomputed absolute paths _repo_abs, _output_abs
+            and _include_abs and the repo-relative slice offset _rel_start.
+        gitignore_spec (GitignoreSpec): Compiled .gitignore patterns, or None
+            when --use-gitignore is not set.
 
     Returns:
-        bool: True if the item should be ignored, False otherwise.
+        callable: should_ignore(entry, is_dir, inside_include) -> bool for
+        os.DirEntry objects whose paths are absolute (the walk starts from
+        args._repo_abs). The caller supplies is_dir so each entry's type is
+        resolved exactly once per walk, and inside_include — whether the
+        entry's parent directory lies inside --include-dir — so the include
+        scope is decided once per directory instead of per file.
     """
+    output_abs = args._output_abs
+    include_abs = args._include_abs
+    rel_start = args._rel_start
+    sep = os.sep
+    ignore_files = args.ignore_files
+
+    settings_exts = SETTINGS_EXTENSIONS if args.ignore_settings else frozenset()
+    file_exts = args.ignore_types | settings_exts
+    dir_exts = settings_exts
+    if args.use_gitignore:
+        # The literal "*.ext" gitignore index stays separate from the sets
+        # above: gitignore matching is case-sensitive, so it is probed with
+        # the un-lowered extension
+        git_exts = gitignore_spec.literal_exts
+        file_names = ignore_files | gitignore_spec.literal_names
+        dir_names = (
+            args.exclude_dir
+            | gitignore_spec.literal_dirs
+            | gitignore_spec.literal_names
+        )
+        match_file = gitignore_spec.match_file
+    else:
+        git_exts = frozenset()
+        file_names = ignore_files
+        dir_names = args.exclude_dir
+        match_file = None
+
+    def should_ignore(entry, is_dir, inside_include):
+        # entry.path is already absolute, so compare path strings directly
+        path = entry.path
+        if path == output_abs:
+            return True
+
+        if not inside_include:
+            # The parent is outside --include-dir, so keep only directories
+            # on the path down to it; everything else is out of scope
+            if not is_dir:
+                return True
+            if path != include_abs and not include_abs.startswith(path + sep):
+                return True
 
-    item_name = os.path.basename(item)
-    file_ext = os.path.splitext(item_name)[1].lower()
+        item_name = entry.name
+        # Inlined os.path.splitext: leading dots mark a hidden file, not an
+        # extension, matching splitext's behavior at a fraction of the cost
+        dot = item_name.rfind(".")
+        if dot > 0 and (item_name[0] != "." or item_name[:dot].strip(".")):
+            raw_ext = item_name[dot:]
+            file_ext = raw_ext.lower()
+        else:
+            raw_ext = file_ext = ""
+
+        if is_dir:
+            if (
+                item_name in dir_names
+                or file_ext in dir_exts
+                or raw_ext in git_exts
+            ):
+                return True
+            return match_file is not None and match_file(path[rel_start:], True)
 
-    # Ensure the comparison is between path strings
-    if os.path.abspath(item) == os.path.abspath(output_file_path):
-        return True
+        if item_name in file_names or file_ext in file_exts or raw_ext in git_exts:
+            return True
+        return match_file is not None and match_file(path[rel_start:], False)
 
-    if os.path.isdir(item) and args.exclude_dir and item_name in args.exclude_dir:
-        return True
+    return should_ignore
 
-    if args.include_dir and not os.path.abspath(item).startswith(
-        os.path.abspath(args.include_dir)
-    ):
-        return True
 
-    if os.path.isfile(item) and (
-        item_name in args.ignore_files or file_ext in args.ignore_types
-    ):
-        return True
+def _translate_gitignore_pattern(pattern):
+    """
+    Translate a single .gitignore pattern into a regular expression body.
 
-    if args.ignore_settings and file_ext in SETTINGS_EXTENSIONS:
-        return True
+    Args:
+        pattern (str): A pattern line from a .gitignore file.
 
-    if args.use_gitignore:
-        for pattern in gitignore_patterns:
-            if os.path.relpath(item, start=args.repo_path).startswith(
-                tuple(pattern.split("/"))
+    Returns:
+        tuple: (regex body matching repository-relative paths, bool that is
+        True if the pattern only applies to directories).
+    """
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+
+    if pattern.startswith("/"):
+        anchored = True
+        pattern = pattern.lstrip("/")
+    else:
+        # A separator anywhere in the pattern anchors it to the repo root
+        anchored = "/" in pattern
+
+    parts = []
+    index = 0
+    length = len(pattern)
+    while index < length:
+        char = pattern[index]
+        if char == "*":
+            # "**" is special only as a whole path segment; consume the
+            # trailing slash with it so zero directories also match
+            # ("**/foo" matches "foo", "a/**/b" matches "a/b")
+            if pattern.startswith("**", index) and (
+                index == 0 or pattern[index - 1] == "/"
             ):
-                return True
-
-    return False
-
+                if pattern.startswith("**/", index):
+                    parts.append("(?:.*/)?")
+                    index += 3
+                    continue
+                if index + 2 == length:
+                    parts.append(".*")
+                    index += 2
+                    continue
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            # Character class: find its end, honoring a leading negation
+            # and a literal "]" as the first member
+            end = index + 1
+            if end < length and pattern[end] in "!^":
+                end += 1
+            if end < length and pattern[end] == "]":
+                end += 1
+            while end < length and pattern[end] != "]":
+                end += 1
+            if end < length:
+                inner = pattern[index + 1 : end]
+                if inner.startswith("!"):
+                    inner = "^" + inner[1:]
+                # A backslash could escape the class's closing bracket in
+                # regex syntax; neutralize it
+                parts.append("[" + inner.replace("\\", "\\\\") + "]")
+                index = end + 1
+                continue
+            # Unterminated class: git treats the bracket as a literal
+            parts.append(re.escape(char))
+        else:
+            parts.append(re.escape(char))
+        index += 1
+
+    prefix = "" if anchored else "(?:.*/)?"
+    return prefix + "".join(parts), dir_only
+
+
+def _is_literal(pattern):
+    """Return True if the pattern contains no glob metacharacters."""
+    return not any(char in "*?[" for char in pattern)
+
+
+class GitignoreSpec:
+    """
+    A set of .gitignore patterns compiled once into regular expressions.
+
+    Matching a path is a single C-level regex call instead of a Python loop
+    over every pattern, and the per-pattern string splitting the old matcher
+    performed on each call is gone entirely. The most common pattern shapes
+    — "*.ext", "dirname/" and bare literal names — are additionally indexed
+    into the literal_exts, literal_dirs and literal_names frozensets so
+    callers can short-circuit most entries with an O(1) set lookup, and
+    literal paths get their own anchored alternation, leaving only true
+    glob patterns for the backtracking regex.
+    """
 
-def load_gitignore_patterns(repo_path):
+    def __init__(self, patterns):
+        """
+        Compile .gitignore patterns into matchers.
+
+        Args:
+            patterns (list): Pattern lines from a .gitignore file, already
+                stripped of comments and blank lines.
+        """
+        literal_exts = set()
+        literal_dirs = set()
+        literal_names = set()
+        literal_path_any = []
+        literal_path_dir = []
+        any_bodies = []
+        dir_bodies = []
+        negation_bodies = []
+        # The O(1) literal indexes are probed before the regexes and would
+        # bypass re-include checks, so they are only built when no negation
+        # patterns are present; otherwise every pattern goes through
+        # match_file, where negations are consulted first
+        index_literals = not any(p.startswith("!") for p in patterns)
+        for pattern in patterns:
+            if pattern.startswith("!"):
+                body, _ = _translate_gitignore_pattern(pattern[1:])
+                negation_bodies.append(body)
+                continue
+            if (
+                index_literals
+                and pattern.startswith("*.")
+                and "/" not in pattern
+                and _is_literal(pattern[2:])
+            ):
+                # Stored in original case: gitignore matching is
+                # case-sensitive, unlike the --ignore-types sets
+                literal_exts.add(pattern[1:])
+                continue
+            if index_literals and pattern.endswith("/"):
+                dir_name = pattern.rstrip("/")
+                if dir_name and "/" not in dir_name and _is_literal(dir_name):
+                    literal_dirs.add(dir_name)
+                    continue
+            if index_literals and _is_literal(pattern):
+                dir_only = pattern.endswith("/")
+                stripped = pattern.strip("/")
+                if "/" in stripped or pattern.startswith("/"):
+                    # Anchored literal path: joined into its own alternation
+                    # so the glob regex only ever sees true glob patterns
+                    target = literal_path_dir if dir_only else literal_path_any
+                    target.append(re.escape(stripped))
+                else:
+                    # Bare literal name matching any entry at any level;
+                    # indexed for an O(1) probe instead of a regex
+                    literal_names.add(stripped)
+                continue
+            body, dir_only = _translate_gitignore_pattern(pattern)
+            (dir_bodies if dir_only else any_bodies).append(body)
+        self.literal_exts = frozenset(literal_exts)
+        self.literal_dirs = frozenset(literal_dirs)
+        self.literal_names = frozenset(literal_names)
+        self._match_lit_any = self._compile(literal_path_any)
+        self._match_lit_dir = self._compile(literal_path_dir)
+        self._match_any = self._compile(any_bodies)
+        self._match_dir = self._compile(dir_bodies)
+        self._match_negate = self._compile(negation_bodies)
+
+    @staticmethod
+    def _compile(bodies):
+        if not bodies:
+            return None
+        return re.compile("^(?:" + "|".join(bodies) + ")$").match
+
+    def match_file(self, rel_path, is_dir):
+        """
+        Check a repository-relative path against the compiled patterns.
+
+        Negated ("!") patterns re-include a matching path. Git's
+        last-match-wins ordering is approximated by giving negations
+        precedence over all ignore patterns.
+
+        Args:
+            rel_path (str): Path relative to the repository root.
+            is_dir (bool): True if the path refers to a directory.
+
+        Returns:
+            bool: True if the path matches an ignore pattern.
+        """
+        if os.sep != "/":
+            rel_path = rel_path.replace(os.sep, "/")
+        if self._match_negate is not None and self._match_negate(rel_path):
+            return False
+        if self._match_lit_any is not None and self._match_lit_any(rel_path):
+            return True
+        if self._match_any is not None and self._match_any(rel_path):
+            return True
+        if not is_dir:
+            return False
+        if self._match_lit_dir is not None and self._match_lit_dir(rel_path):
+            return True
+        return bool(self._match_dir is not None and self._match_dir(rel_path))
+
+
+def load_gitignore_spec(repo_path):
     """
-    Load .gitignore patterns from the specified repository path.
+    Load .gitignore patterns from the specified repository path and compile
+    them into a GitignoreSpec.
 
     Args:
         repo_path (str): Path to the repository directory.
 
     Returns:
-        list: List of patterns from the .gitignore file.
+        GitignoreSpec: Compiled patterns from the .gitignore file (empty if
+        no .gitignore exists).
     """
     gitignore_path = os.path.join(repo_path, ".gitignore")
     patterns = []
 
     if os.path.exists(gitignore_path):
-        with open(gitignore_path, "r", encoding="utf-8") as gitignore_file:
-            patterns = [
-                pattern.strip()
-                for pattern in gitignore_file.readlines()
-                if pattern.strip() and not pattern.strip().startswith("#")
-            ]
-
-    return patterns
-
-
-def write_tree(
-    dir_path,
-    output_file,
-    args,
-    gitignore_patterns,
-    prefix="",
-    is_last=True,
-    is_root=True,
-):
+        # One read + splitlines instead of readlines(), which allocates a
+        # list and decodes line by line; strip runs once per line here
+        with open(gitignore_path, "rb") as gitignore_file:
+            data = gitignore_file.read()
+        patterns = [
+            line
+            for line in (raw.strip() for raw in data.decode("utf-8").splitlines())
+            if line and not line.startswith("#")
+        ]
+
+    return GitignoreSpec(patterns)
+
+
+def walk_repo(dir_path, args, gitignore_spec, tree_lines, file_entries):
     """
-    Recursively write the directory tree to the output file, including the root directory name.
+    Walk the repository once, collecting both the directory tree lines and
+    the files whose contents should be documented.
+
+    Fusing the two passes means should_ignore runs once per entry and the
+    scandir type information is reused, instead of re-walking and re-statting
+    the whole tree for the file-content section. The walk is driven by an
+    explicit stack rather than recursion, so deep trees cost neither a
+    Python frame per directory nor recursion-limit headroom; directory
+    expansion is inlined in the loop and the hot methods are pre-bound to
+    locals. Pruned directories are never descended into, and surviving
+    children are pushed in reverse-sorted order so they pop in display
+    order.
 
     Args:
-        dir_path (str): The path of the directory to document.
-        output_file (file object): The file object to write to.
+        dir_path (str): The path of the root directory to document.
         args (argparse.Namespace): Parsed command-line arguments.
-        gitignore_patterns (list): List of patterns from .gitignore file.
-        prefix (str): Prefix string for line indentation and structure. Defaults to "".
-        is_last (bool): Flag to indicate if the item is the last in its level. Defaults to True.
-        is_root (bool): Flag to indicate if the current directory is the root. Defaults to True.
+        gitignore_spec (GitignoreSpec): Compiled .gitignore patterns.
+        tree_lines (list): Accumulates the lines of the directory tree.
+        file_entries (list): Accumulates (file_path, depth, relative_path)
+            tuples in the order file contents should be written.
     """
+    tree_lines.append(f"{os.path.basename(dir_path)}/\n")
+    rel_start = args._rel_start
+    should_ignore = make_should_ignore(args, gitignore_spec)
+    add_tree_line = tree_lines.append
+    add_file_entry = file_entries.append
+
+    include_abs = args._include_abs
+    root_inside = include_abs is None or dir_path == include_abs or dir_path.startswith(
+        include_abs + os.sep
+    )
 
-    if is_root:
-        output_file.write(f"{os.path.basename(dir_path)}/\n")
-        is_root = False
-
-    items = os.listdir(dir_path)
-    items.sort()  # Optional: Sort the items for consistent order
-    num_items = len(items)
+    # Each stack item is (entry, is_dir, prefix, depth, is_last, inside);
+    # inside records whether the entry lies inside --include-dir, decided
+    # once per directory and inherited by the whole subtree. The root
+    # sentinel has no entry and only expands its children.
+    stack = [(None, True, "", 0, True, root_inside)]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        entry, is_dir, prefix, depth, is_last, inside = pop()
+
+        if entry is None:
+            current_path = dir_path
+            child_prefix = ""
+            child_depth = 0
+        else:
+            add_tree_line(f"{prefix}{'└── ' if is_last else '├── '}{entry.name}\n")
+            if not is_dir:
+                if entry.is_file(follow_symlinks=False):
+                    add_file_entry((entry.path, depth, entry.path[rel_start:]))
+                continue
+            current_path = entry.path
+            child_prefix = prefix + ("    " if is_last else "│   ")
+            child_depth = depth + 1
+
+        # Children enter the include scope when this is the include dir
+        children_inside = inside or current_path == include_abs
+
+        with os.scandir(current_path) as it:
+            children = sorted(it, key=_ENTRY_NAME)
+        kept = []
+        for child in children:
+            # Resolve the entry type once, from scandir's cached d_type,
+            # and carry it on the stack so it is never re-queried
+            child_is_dir = child.is_dir(follow_symlinks=False)
+            if not should_ignore(child, child_is_dir, children_inside):
+                kept.append((child, child_is_dir))
+        last_index = len(kept) - 1
+        for index in range(last_index, -1, -1):
+            child, child_is_dir = kept[index]
+            push(
+                (
+                    child,
+                    child_is_dir,
+                    child_prefix,
+                    child_depth,
+                    index == last_index,
+                    children_inside,
+                )
+            )
 
-    for index, item in enumerate(items):
-        item_path = os.path.join(dir_path, item)
 
-        if should_ignore(item_path, args, args.output_file, gitignore_patterns):
-            continue
+def read_and_format(file_entry):
+    """
+    Read one file and return its fully formatted content section as bytes,
+    including the [File Begins]/[File Ends] markers and indentation.
 
-        is_last_item = index == num_items - 1
-        new_prefix = "└── " if is_last_item else "├── "
-        child_prefix = "    " if is_last_item else "│   "
+    Runs on worker threads: the file read releases the GIL, so reads overlap
+    disk latency while the single writer thread keeps the output ordered.
+    Files larger than _MAX_INLINE_SIZE are not buffered whole; the worker
+    returns None and the writer streams them from disk in chunks instead.
 
-        output_file.write(f"{prefix}{new_prefix}{os.path.basename(item)}\n")
+    Args:
+        file_entry (tuple): (file_path, depth, relative_path) as collected
+            by walk_repo.
 
-        if os.path.isdir(item_path):
-            next_prefix = prefix + child_prefix
-            write_tree(
-                item_path,
-                output_file,
-                args,
-                gitignore_patterns,
-                next_prefix,
-                is_last_item,
-                is_root=False,
+    Returns:
+        bytes: The complete content section for the file, or None if the
+        file is too large to format in memory.
+    """
+    file_path, depth, relative_path = file_entry
+    indent = "  " * depth
+    parts = [f"{indent}[File Begins] {relative_path}\n".encode()]
+    try:
+        with open(file_path, "rb") as file:
+            content = file.read(_MAX_INLINE_SIZE + 1)
+    except Exception as e:
+        parts.append(f"{indent}Error reading file: {e}\n".encode())
+    else:
+        if len(content) > _MAX_INLINE_SIZE:
+            return None
+        if depth and content:
+            # Indent each line in one C-level replace instead of
+            # allocating a new string per line
+            indent_bytes = indent.encode()
+            content = indent_bytes + content.replace(
+                b"\n", b"\n" + indent_bytes
             )
+            if content.endswith(b"\n" + indent_bytes):
+                # Drop the indent added after the final newline
+                content = content[: -len(indent_bytes)]
+        parts.append(content)
+    parts.append(f"\n{indent}[File Ends] {relative_path}\n\n".encode())
+    return b"".join(parts)
 
 
-def write_file_content(file_path, output_file, depth):
+def _stream_file_content(file_entry, buffer):
     """
-    Write the contents of a given file to the output file with proper indentation.
+    Write one large file's content section by streaming it from disk in
+    _CHUNK_SIZE blocks, so memory use stays constant regardless of file
+    size. Produces exactly the same bytes as read_and_format.
 
     Args:
-        file_path (str): Path of the file to read.
-        output_file (file object): The file object to write the contents to.
-        depth (int): Current depth in the directory tree for indentation.
+        file_entry (tuple): (file_path, depth, relative_path) as collected
+            by walk_repo.
+        buffer (file object): The binary buffer of the output file.
     """
-    indentation = "  " * depth
+    file_path, depth, relative_path = file_entry
+    indent = "  " * depth
+    buffer.write(f"{indent}[File Begins] {relative_path}\n".encode())
+    indent_bytes = indent.encode()
+    newline_indent = b"\n" + indent_bytes
     try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as file:
-            for line in file:
-                # Indent each line of the file content
-                output_file.write(f"{indentation}{line}")
+        with open(file_path, "rb") as file:
+            at_line_start = True
+            while True:
+                chunk = file.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if indent_bytes:
+                    formatted = chunk.replace(b"\n", newline_indent)
+                    if at_line_start:
+                        formatted = indent_bytes + formatted
+                    if chunk.endswith(b"\n"):
+                        # Drop the indent added after the chunk's final
+                        # newline; the next chunk (if any) re-adds it
+                        formatted = formatted[: -len(indent_bytes)]
+                        at_line_start = True
+                    else:
+                        at_line_start = False
+                    buffer.write(formatted)
+                else:
+                    buffer.write(chunk)
     except Exception as e:
-        output_file.write(f"{indentation}Error reading file: {e}\n")
+        buffer.write(f"{indent}Error reading file: {e}\n".encode())
+    buffer.write(f"\n{indent}[File Ends] {relative_path}\n\n".encode())
 
 
-def write_file_contents_in_order(
-    dir_path, output_file, args, gitignore_patterns, depth=0
-):
+def write_file_contents_in_order(file_entries, output_file):
     """
-    Recursively document the contents of files in the order they appear in the directory tree.
+    Document the contents of the collected files in tree order.
+
+    File reads and formatting run on a thread pool while this thread writes
+    the results in order on the single output descriptor. Submissions are
+    capped to a sliding window a few times the pool size, so completed
+    blobs waiting behind a slow earlier file stay bounded instead of
+    accumulating the whole repository in memory; oversized files are
+    streamed from disk by the writer itself.
 
     Args:
-        dir_path (str): The path of the directory to start documenting from.
+        file_entries (list): (file_path, depth, relative_path) tuples as
+            collected by walk_repo.
         output_file (file object): The file object to write the contents to.
-        args (argparse.Namespace): Parsed command-line arguments.
-        gitignore_patterns (list): List of patterns from .gitignore file.
-        depth (int): Current depth in the directory tree. Defaults to 0.
     """
-    items = sorted(
-        item
-        for item in os.listdir(dir_path)
-        if not should_ignore(
-            os.path.join(dir_path, item), args, args.output_file, gitignore_patterns
-        )
-    )
-
-    for item in items:
-        item_path = os.path.join(dir_path, item)
-        relative_path = os.path.relpath(item_path, start=args.repo_path)
-
-        if os.path.isdir(item_path):
-            write_file_contents_in_order(
-                item_path, output_file, args, gitignore_patterns, depth + 1
-            )
-        elif os.path.isfile(item_path):
-            output_file.write("  " * depth + f"[File Begins] {relative_path}\n")
-            write_file_content(item_path, output_file, depth)
-            output_file.write("\n" + "  " * depth + f"[File Ends] {relative_path}\n\n")
+    # Blobs are raw bytes; flush the text wrapper so they stay ordered
+    output_file.flush()
+    buffer = output_file.buffer
+    window = _MAX_READ_WORKERS * 4
+    total = len(file_entries)
+    with ThreadPoolExecutor(max_workers=_MAX_READ_WORKERS) as executor:
+        pending = deque()
+        next_index = 0
+        while next_index < total and len(pending) < window:
+            pending.append(executor.submit(read_and_format, file_entries[next_index]))
+            next_index += 1
+        write_index = 0
+        while pending:
+            blob = pending.popleft().result()
+            if next_index < total:
+                pending.append(
+                    executor.submit(read_and_format, file_entries[next_index])
+                )
+                next_index += 1
+            if blob is None:
+                _stream_file_content(file_entries[write_index], buffer)
+            else:
+                buffer.write(blob)
+            write_index += 1
 
 
 def main():
@@ -291,23 +668,37 @@ def main():
     """
     args = parse_args()
 
-    # Convert 'none' keyword to empty list
-    args.ignore_files = [] if args.ignore_files == ["none"] else args.ignore_files
+    # Convert 'none' keyword to an empty set; frozensets give O(1) lookups
+    # in should_ignore, which tests membership once per filesystem entry
+    args.ignore_files = (
+        frozenset() if args.ignore_files == ["none"] else frozenset(args.ignore_files)
+    )
     args.ignore_types = (
-        []
+        frozenset()
         if args.ignore_types == ["none"]
-        else IMAGE_EXTENSIONS
-        + VIDEO_EXTENSIONS
-        + AUDIO_EXTENSIONS
-        + DOCUMENT_EXTENSIONS
-        + EXECUTABLE_EXTENSIONS
-        + ADDITIONAL_IGNORE_TYPES
+        else _DEFAULT_IGNORE_TYPES_WITH_EXTRA
+    )
+    args.exclude_dir = (
+        frozenset() if args.exclude_dir == ["none"] else frozenset(args.exclude_dir)
+    )
+
+    # Resolve the constant paths once; should_ignore runs per filesystem entry
+    args._repo_abs = os.path.abspath(args.repo_path)
+    # Slice offset turning an absolute path into a repo-relative one; the
+    # filesystem root already ends with a separator, so nothing is skipped
+    args._rel_start = (
+        len(args._repo_abs)
+        if args._repo_abs.endswith(os.sep)
+        else len(args._repo_abs) + 1
+    )
+    args._output_abs = os.path.abspath(args.output_file)
+    args._include_abs = (
+        os.path.abspath(args.include_dir) if args.include_dir else None
     )
-    args.exclude_dir = [] if args.exclude_dir == ["none"] else args.exclude_dir
 
     # Load .gitignore patterns
-    gitignore_patterns = (
-        load_gitignore_patterns(args.repo_path) if args.use_gitignore else []
+    gitignore_spec = (
+        load_gitignore_spec(args.repo_path) if args.use_gitignore else None
     )
 
     # Check if the provided directory path is valid
@@ -317,9 +708,18 @@ def main():
         )
         return  # Exit the script
 
-    with open(args.output_file, "w") as output_file:
-        output_file.write("Repository Documentation\n")
+    tree_lines = []
+    file_entries = []
+    walk_repo(args._repo_abs, args, gitignore_spec, tree_lines, file_entries)
+
+    with open(
+        args.output_file, "w", buffering=_CHUNK_SIZE, encoding="utf-8"
+    ) as output_file:
+        # Everything up to the file contents is joined and written in one
+        # call, so the whole tree section costs a single encode and write
+        # instead of one per line
         output_file.write(
+            "Repository Documentation\n"
             "This document provides a comprehensive overview of the repository's structure and contents.\n"
             "The first section, titled 'Directory/File Tree', displays the repository's hierarchy in a tree format.\n"
             "In this section, directories and files are listed using tree branches to indicate their structure and relationships.\n"
@@ -327,23 +727,12 @@ def main():
             "Each file's content is introduced with a '[File Begins]' marker followed by the file's relative path,\n"
             "and the content is displayed verbatim. The end of each file's content is marked with a '[File Ends]' marker.\n"
             "This format ensures a clear and orderly presentation of both the structure and the detailed contents of the repository.\n\n"
+            "Directory/File Tree Begins -->\n\n"
+            + "".join(tree_lines)
+            + "\n<-- Directory/File Tree Ends"
+            "\n\nFile Content Begin -->\n"
         )
-
-        output_file.write("Directory/File Tree Begins -->\n\n")
-        write_tree(
-            args.repo_path,
-            output_file,
-            args,
-            gitignore_patterns,
-            "",
-            is_last=True,
-            is_root=True,
-        )
-        output_file.write("\n<-- Directory/File Tree Ends")
-        output_file.write("\n\nFile Content Begin -->\n")
-        write_file_contents_in_order(
-            args.repo_path, output_file, args, gitignore_patterns
-        )
+        write_file_contents_in_order(file_entries, output_file)
         output_file.write("\n<-- File Content Ends\n\n")
 
 